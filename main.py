@@ -5,16 +5,16 @@ Monitors a web page for changes and sends email notifications when detected.
 """
 
 import sys
-from datetime import datetime
 
 from src.config import Config, ConfigError, load_config, validate_config
 from src.monitor import MonitorError, check_for_changes
 from src.notifier import notify_change
+from src.timestamps import format_timestamp
 
 
 def log(message: str) -> None:
     """Print a timestamped log message."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = format_timestamp()
     print(f"[{timestamp}] {message}")
 
 
@@ -1,9 +1,13 @@
 """Configuration module for the Developer Activity Monitor."""
 
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
+
+
+# Basic email address shape: local part, "@", and a dotted domain
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 @dataclass
@@ -37,12 +41,18 @@ def load_config() -> Config:
     Raises:
         ConfigError: If required environment variables are missing.
     """
+    # Imported here so the dependency is only loaded when config is read
+    from dotenv import load_dotenv
+
     # Load .env file if it exists
     load_dotenv()
 
+    # Snapshot the environment once instead of querying it per variable
+    env = os.environ.copy()
+
     # Required variables
     required_vars = ["MONITOR_URL", "EMAIL_FROM", "EMAIL_TO", "EMAIL_PASSWORD"]
-    missing = [var for var in required_vars if not os.getenv(var)]
+    missing = [var for var in required_vars if not env.get(var)]
 
     if missing:
         raise ConfigError(
@@ -50,24 +60,24 @@ def load_config() -> Config:
         )
 
     # Parse optional selector (empty string means None)
-    check_selector = os.getenv("CHECK_SELECTOR", "").strip() or None
+    check_selector = env.get("CHECK_SELECTOR", "").strip() or None
 
     # Parse SMTP port with validation
-    smtp_port_str = os.getenv("EMAIL_SMTP_PORT", "465")
+    smtp_port_str = env.get("EMAIL_SMTP_PORT", "465")
     try:
         smtp_port = int(smtp_port_str)
     except ValueError:
         raise ConfigError(f"Invalid EMAIL_SMTP_PORT value: {smtp_port_str}")
 
     return Config(
-        monitor_url=os.getenv("MONITOR_URL", ""),
-        email_from=os.getenv("EMAIL_FROM", ""),
-        email_to=os.getenv("EMAIL_TO", ""),
-        email_password=os.getenv("EMAIL_PASSWORD", ""),
+        monitor_url=env.get("MONITOR_URL", ""),
+        email_from=env.get("EMAIL_FROM", ""),
+        email_to=env.get("EMAIL_TO", ""),
+        email_password=env.get("EMAIL_PASSWORD", ""),
         check_selector=check_selector,
-        email_smtp_host=os.getenv("EMAIL_SMTP_HOST", "smtp.gmail.com"),
+        email_smtp_host=env.get("EMAIL_SMTP_HOST", "smtp.gmail.com"),
         email_smtp_port=smtp_port,
-        hash_storage_path=os.getenv("HASH_STORAGE_PATH", "last_hash.txt"),
+        hash_storage_path=env.get("HASH_STORAGE_PATH", "last_hash.txt"),
     )
 
 
@@ -87,10 +97,10 @@ def validate_config(config: Config) -> None:
         )
 
     # Validate email addresses (basic check)
-    if "@" not in config.email_from:
+    if not _EMAIL_RE.fullmatch(config.email_from):
         raise ConfigError(f"Invalid EMAIL_FROM: must be a valid email address")
 
-    if "@" not in config.email_to:
+    if not _EMAIL_RE.fullmatch(config.email_to):
         raise ConfigError(f"Invalid EMAIL_TO: must be a valid email address")
 
     # Validate SMTP port range
@@ -1,46 +1,182 @@
 """Monitor module for web page change detection."""
 
 import hashlib
+import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-
-import requests
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 from .config import Config
 
+# requests, bs4 and selectolax are imported on first use so that runs which
+# exit early (e.g. on a configuration error) never pay their import cost
+if TYPE_CHECKING:
+    import requests
+    import soupsieve
+
+# Prefer orjson for the state file; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Class names commonly used for tracking/ads
+_TRACKING_CLASS_RE = re.compile(r"ad|tracking|analytics", re.I)
+
+# Elements that change on every load
+_DYNAMIC_TAGS = frozenset({"script", "style", "noscript", "iframe"})
+
+# Everything the lexbor backend removes, matched in C by a single query. The
+# case-insensitive substring matches mirror _TRACKING_CLASS_RE.
+_STRIP_SELECTOR = (
+    "script, style, noscript, iframe, [data-timestamp], [data-nonce], "
+    '[class*="ad" i], [class*="tracking" i], [class*="analytics" i]'
+)
+
 
 class MonitorError(Exception):
     """Raised when monitoring operations fail."""
     pass
 
 
-def fetch_page_content(url: str, timeout: int = 30) -> str:
+@dataclass
+class PageResponse:
+    """A fetched page along with its cache validators."""
+
+    content: bytes
+    encoding: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    raw_hash: str | None = None
+
+    @property
+    def text(self) -> str:
+        """The page body decoded to text."""
+        try:
+            return self.content.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            return self.content.decode("utf-8", errors="replace")
+
+
+# Size of the chunks the response body is streamed and hashed in
+_CHUNK_SIZE = 65536
+
+# Parent directories of hash files already created in this process
+_dir_ready: set[str] = set()
+
+# Shared session so repeat requests to the same host reuse connections
+_SESSION: "requests.Session | None" = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+            })
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                # Hand the final error response back to raise_for_status(), and
+                # don't let a large Retry-After stall the run past its timeout
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                    respect_retry_after_header=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and its pooled connections."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+def fetch_page_content(
+    url: str,
+    timeout: int = 30,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> PageResponse | None:
     """Fetch the content of a web page.
 
+    When validators from a previous response are given, the request is made
+    conditional so an unchanged page comes back as an empty 304. The body is
+    streamed and hashed chunk by chunk as it arrives.
+
     Args:
         url: The URL to fetch.
         timeout: Request timeout in seconds.
+        etag: ETag from a previous response, sent as If-None-Match.
+        last_modified: Last-Modified from a previous response, sent as
+            If-Modified-Since.
 
     Returns:
-        The page content as a string.
+        The fetched page, or None if the server reported 304 Not Modified.
 
     Raises:
         MonitorError: If the request fails.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
+    import requests
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        return response.text
+        response = _get_session().get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+
+            digest = hashlib.sha256()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                digest.update(chunk)
+                chunks.append(chunk)
+            body = b"".join(chunks)
+        finally:
+            response.close()
+
+        return PageResponse(
+            content=body,
+            encoding=response.encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            raw_hash=digest.hexdigest(),
+        )
     except requests.exceptions.Timeout:
         raise MonitorError(f"Request timed out after {timeout} seconds")
     except requests.exceptions.HTTPError as e:
@@ -64,84 +200,227 @@ def extract_content(html: str, selector: str | None = None) -> str:
     Raises:
         MonitorError: If selector doesn't match any element.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if _lexbor_parser() is not None:
+        content = _extract_with_lexbor(html, selector)
+    else:
+        content = _extract_with_soup(html, selector)
+
+    # Normalize whitespace
+    content = " ".join(content.split())
 
-    # Remove dynamic elements that change on every load
-    for tag in soup.find_all(["script", "style", "noscript", "iframe"]):
-        tag.decompose()
+    return content
+
+
+@lru_cache(maxsize=None)
+def _lexbor_parser():
+    """Return selectolax's lexbor parser class, or None if not installed."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+    return LexborHTMLParser
 
-    # Remove elements commonly used for tracking/ads
-    for tag in soup.find_all(attrs={"class": re.compile(r"ad|tracking|analytics", re.I)}):
-        tag.decompose()
 
-    # Remove elements with dynamic attributes
-    for tag in soup.find_all(attrs={"data-timestamp": True}):
-        tag.decompose()
-    for tag in soup.find_all(attrs={"data-nonce": True}):
-        tag.decompose()
+@lru_cache(maxsize=None)
+def _soup_parser() -> str:
+    """Return the BeautifulSoup parser name, preferring the C-backed lxml."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+def _extract_with_lexbor(html: str, selector: str | None) -> str:
+    """Extract text from HTML using selectolax's lexbor engine."""
+    tree = _lexbor_parser()(html)
+    root = tree.root
+    root_removed = False
+
+    # Remove dynamic, tracking/ad and dynamic-attribute elements in one pass
+    for node in tree.css(_STRIP_SELECTOR):
+        # lexbor refuses to decompose the <html> element itself
+        if root is not None and node.mem_id == root.mem_id:
+            root_removed = True
+            continue
+        node.decompose()
+
+    # A matching <html> element removes the whole document, as with bs4
+    if root_removed:
+        root = None
 
     # If selector provided, extract specific element
     if selector:
-        element = soup.select_one(selector)
+        from selectolax.lexbor import SelectolaxError
+
+        try:
+            element = tree.css_first(selector) if root is not None else None
+        except SelectolaxError:
+            raise MonitorError(f"Invalid CSS selector '{selector}'")
         if element is None:
             raise MonitorError(f"Selector '{selector}' did not match any element")
-        content = element.get_text(separator=" ", strip=True)
-    else:
-        content = soup.get_text(separator=" ", strip=True)
+        return element.text(separator=" ", strip=True)
 
-    # Normalize whitespace
-    content = re.sub(r"\s+", " ", content).strip()
+    if root is None:
+        return ""
+    return root.text(separator=" ", strip=True)
 
-    return content
+
+@lru_cache(maxsize=16)
+def _compiled_selector(selector: str) -> "soupsieve.SoupSieve":
+    """Compile a CSS selector once and reuse it across calls."""
+    import soupsieve
+
+    return soupsieve.compile(selector)
 
 
-def compute_hash(content: str) -> str:
+def _extract_with_soup(html: str, selector: str | None) -> str:
+    """Extract text from HTML using BeautifulSoup."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        raise MonitorError(
+            "No HTML parser available: install selectolax, or beautifulsoup4 "
+            "for the fallback parser"
+        )
+
+    soup = BeautifulSoup(html, _soup_parser())
+
+    # Remove dynamic, tracking/ad and dynamic-attribute elements in one pass
+    for tag in soup.find_all(True):
+        # Already removed along with a decomposed ancestor
+        if tag.decomposed:
+            continue
+        if (
+            tag.name in _DYNAMIC_TAGS
+            or tag.has_attr("data-timestamp")
+            or tag.has_attr("data-nonce")
+            or _TRACKING_CLASS_RE.search(" ".join(tag.get("class") or []))
+        ):
+            tag.decompose()
+
+    # If selector provided, extract specific element
+    if selector:
+        import soupsieve
+
+        try:
+            element = _compiled_selector(selector).select_one(soup)
+        except soupsieve.SelectorSyntaxError:
+            raise MonitorError(f"Invalid CSS selector '{selector}'")
+        if element is None:
+            raise MonitorError(f"Selector '{selector}' did not match any element")
+        return element.get_text(separator=" ", strip=True)
+
+    return soup.get_text(separator=" ", strip=True)
+
+
+def compute_hash(content: bytes | str) -> str:
     """Compute SHA256 hash of content.
 
     Args:
-        content: The content to hash.
+        content: The content to hash, as raw bytes or text (hashed as UTF-8).
 
     Returns:
         Hexadecimal hash string.
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
 
 
-def load_previous_hash(path: str) -> str | None:
-    """Load the previous hash from file.
+def load_state(path: str) -> dict:
+    """Load the stored monitor state from file.
+
+    The state is a JSON object holding the content hash and the cache
+    validators of the response it came from. Files written by older
+    versions contain only the bare hash and are read as such.
 
     Args:
         path: Path to the hash file.
 
     Returns:
-        The previous hash, or None if file doesn't exist.
+        The stored state, or an empty dict if file doesn't exist.
     """
     try:
         hash_path = Path(path)
-        if hash_path.exists():
-            return hash_path.read_text().strip()
-        return None
+        if not hash_path.exists():
+            return {}
+        raw = hash_path.read_bytes().strip()
     except (IOError, OSError):
-        return None
+        return {}
+
+    try:
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        state = None
+    if isinstance(state, dict):
+        return state
+
+    # Legacy format: the file holds just the hash
+    return {"hash": raw.decode("utf-8", errors="replace")} if raw else {}
+
+
+def load_previous_hash(path: str) -> str | None:
+    """Load the previous hash from file.
 
+    Args:
+        path: Path to the hash file.
+
+    Returns:
+        The previous hash, or None if file doesn't exist.
+    """
+    return load_state(path).get("hash")
 
-def save_hash(path: str, hash_value: str) -> None:
-    """Save hash to file.
+
+def save_hash(
+    path: str,
+    hash_value: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    raw_hash: str | None = None,
+) -> None:
+    """Save hash and cache validators to file.
 
     Args:
         path: Path to the hash file.
         hash_value: The hash to save.
+        etag: ETag of the response the hash was computed from.
+        last_modified: Last-Modified of the response the hash was computed from.
+        raw_hash: Hash of the raw response body the hash was computed from.
     """
+    state = {
+        "hash": hash_value,
+        "etag": etag,
+        "last_modified": last_modified,
+        "raw_hash": raw_hash,
+    }
     hash_path = Path(path)
-    hash_path.parent.mkdir(parents=True, exist_ok=True)
-    hash_path.write_text(hash_value)
+    parent = str(hash_path.parent)
+    if parent not in _dir_ready:
+        hash_path.parent.mkdir(parents=True, exist_ok=True)
+        _dir_ready.add(parent)
+
+    # Write to a temporary file and rename so a crash never leaves a partial file
+    tmp_path = hash_path.with_name(hash_path.name + ".tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(state))
+    else:
+        tmp_path.write_text(json.dumps(state))
+    os.replace(tmp_path, hash_path)
 
 
-def check_for_changes(config: Config) -> tuple[bool, str]:
-    """Check if the monitored page has changed.
+def _save_page_hash(path: str, hash_value: str, page: PageResponse) -> None:
+    """Save a content hash together with the state of the page it came from."""
+    save_hash(path, hash_value, page.etag, page.last_modified, raw_hash=page.raw_hash)
+
+
+def check_page(url: str, selector: str | None, hash_path: str) -> tuple[bool, str]:
+    """Check if a single page has changed.
 
     Args:
-        config: The application configuration.
+        url: The URL to check.
+        selector: Optional CSS selector to extract specific element.
+        hash_path: Path to the hash file for this page.
 
     Returns:
         Tuple of (has_changed, message).
@@ -151,22 +430,96 @@ def check_for_changes(config: Config) -> tuple[bool, str]:
     Raises:
         MonitorError: If monitoring fails.
     """
-    # Fetch and process page content
-    html = fetch_page_content(config.monitor_url)
-    content = extract_content(html, config.check_selector)
-    current_hash = compute_hash(content)
+    state = load_state(hash_path)
+    previous_hash = state.get("hash")
+
+    # Only ask for a 304 when there is a baseline to fall back on
+    if previous_hash is None:
+        page = fetch_page_content(url)
+    else:
+        page = fetch_page_content(
+            url, etag=state.get("etag"), last_modified=state.get("last_modified")
+        )
 
-    # Compare with previous hash
-    previous_hash = load_previous_hash(config.hash_storage_path)
+    if page is None:
+        return False, "No changes detected (304 Not Modified)"
+
+    if previous_hash is not None and page.raw_hash == state.get("raw_hash"):
+        # Byte-identical body, so the extracted content is unchanged too
+        current_hash = previous_hash
+        message = "No changes detected (raw match)"
+    else:
+        # Process page content
+        content = extract_content(page.text, selector)
+        current_hash = compute_hash(content)
+        message = "No changes detected (page bytes changed, content did not)"
 
     if previous_hash is None:
         # First run - save hash and report no change
-        save_hash(config.hash_storage_path, current_hash)
+        _save_page_hash(hash_path, current_hash, page)
         return False, "First run - baseline hash saved"
 
     if current_hash == previous_hash:
-        return False, "No changes detected"
+        # Keep validators and raw hash current so the next check can skip work
+        if (page.etag, page.last_modified, page.raw_hash) != (
+            state.get("etag"), state.get("last_modified"), state.get("raw_hash")
+        ):
+            _save_page_hash(hash_path, current_hash, page)
+        return False, message
 
     # Change detected - save new hash
-    save_hash(config.hash_storage_path, current_hash)
+    _save_page_hash(hash_path, current_hash, page)
     return True, "Change detected on monitored page"
+
+
+def check_pages(
+    targets: list[tuple[str, str | None, str]],
+    max_workers: int = 8,
+) -> list[tuple[bool, str] | MonitorError]:
+    """Check several pages concurrently.
+
+    Each page keeps its own hash file, so checks run independently while
+    sharing the pooled HTTP session. A page that fails with MonitorError
+    does not abort the others: a page that changed has already saved its
+    new hash, so its result must still reach the caller.
+
+    Args:
+        targets: List of (url, selector, hash_path) tuples.
+        max_workers: Maximum number of pages checked at once.
+
+    Returns:
+        One entry per target, in the order of targets: a
+        (has_changed, message) tuple, or the MonitorError raised while
+        checking that page.
+
+    Raises:
+        Exception: Any other error raised while checking a page, re-raised
+            once every page has finished.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(check_page, *target) for target in targets]
+
+    results: list[tuple[bool, str] | MonitorError] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except MonitorError as e:
+            results.append(e)
+    return results
+
+
+def check_for_changes(config: Config) -> tuple[bool, str]:
+    """Check if the monitored page has changed.
+
+    Args:
+        config: The application configuration.
+
+    Returns:
+        Tuple of (has_changed, message).
+        - has_changed: True if page content changed.
+        - message: Description of what happened (for logging).
+
+    Raises:
+        MonitorError: If monitoring fails.
+    """
+    return check_page(config.monitor_url, config.check_selector, config.hash_storage_path)
@@ -1,11 +1,12 @@
 """Notifier module for sending email notifications."""
 
+import atexit
 import smtplib
 import ssl
-from datetime import datetime
 from email.message import EmailMessage
 
 from .config import Config
+from .timestamps import format_timestamp
 
 
 class NotifierError(Exception):
@@ -13,6 +14,108 @@ class NotifierError(Exception):
     pass
 
 
+class Notifier:
+    """Sends email notifications over a persistent SMTP connection.
+
+    The connection is opened and logged in on the first send and reused for
+    later ones, reconnecting if the server has dropped it.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self._smtp: smtplib.SMTP_SSL | None = None
+
+    def _connect(self) -> smtplib.SMTP_SSL:
+        """Open a new SMTP connection and log in."""
+        context = ssl.create_default_context()
+        server = smtplib.SMTP_SSL(
+            self.config.email_smtp_host,
+            self.config.email_smtp_port,
+            context=context
+        )
+        try:
+            server.login(self.config.email_from, self.config.email_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _connection(self) -> smtplib.SMTP_SSL:
+        """Return a live SMTP connection, reconnecting if needed."""
+        if self._smtp is not None:
+            try:
+                # An idle-timeout reply such as 421 also means the session is gone
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except smtplib.SMTPServerDisconnected:
+                pass
+            self.close()
+        return self._connect()
+
+    def send(self, subject: str, body: str) -> bool:
+        """Send an email notification.
+
+        Args:
+            subject: Email subject line.
+            body: Email body text.
+
+        Returns:
+            True if email sent successfully, False otherwise.
+        """
+        msg = EmailMessage()
+        msg["From"] = self.config.email_from
+        msg["To"] = self.config.email_to
+        msg["Subject"] = subject
+        msg.set_content(body)
+
+        try:
+            server = self._connection()
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the liveness check and the send
+                self._smtp = None
+                self._connect().send_message(msg)
+            return True
+        except smtplib.SMTPAuthenticationError:
+            print("ERROR: SMTP authentication failed. Check your email and password.")
+            print("       If using Gmail, ensure you're using an App Password.")
+        except smtplib.SMTPException as e:
+            print(f"ERROR: Failed to send email: {e}")
+        except Exception as e:
+            print(f"ERROR: Unexpected error sending email: {e}")
+
+        # Start from a fresh connection on the next send
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Close the SMTP connection if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
+
+
+# Shared notifier so repeat notifications reuse the SMTP connection
+_NOTIFIER: Notifier | None = None
+
+
+def close_notifier() -> None:
+    """Close the shared notifier's SMTP connection."""
+    global _NOTIFIER
+    if _NOTIFIER is not None:
+        _NOTIFIER.close()
+        _NOTIFIER = None
+
+
+atexit.register(close_notifier)
+
+
 def send_email(config: Config, subject: str, body: str) -> bool:
     """Send an email notification.
 
@@ -24,33 +127,11 @@ def send_email(config: Config, subject: str, body: str) -> bool:
     Returns:
         True if email sent successfully, False otherwise.
     """
-    msg = EmailMessage()
-    msg["From"] = config.email_from
-    msg["To"] = config.email_to
-    msg["Subject"] = subject
-    msg.set_content(body)
-
-    context = ssl.create_default_context()
-
-    try:
-        with smtplib.SMTP_SSL(
-            config.email_smtp_host,
-            config.email_smtp_port,
-            context=context
-        ) as server:
-            server.login(config.email_from, config.email_password)
-            server.send_message(msg)
-        return True
-    except smtplib.SMTPAuthenticationError:
-        print("ERROR: SMTP authentication failed. Check your email and password.")
-        print("       If using Gmail, ensure you're using an App Password.")
-        return False
-    except smtplib.SMTPException as e:
-        print(f"ERROR: Failed to send email: {e}")
-        return False
-    except Exception as e:
-        print(f"ERROR: Unexpected error sending email: {e}")
-        return False
+    global _NOTIFIER
+    if _NOTIFIER is None or _NOTIFIER.config != config:
+        close_notifier()
+        _NOTIFIER = Notifier(config)
+    return _NOTIFIER.send(subject, body)
 
 
 def notify_change(config: Config, url: str) -> bool:
@@ -63,7 +144,7 @@ def notify_change(config: Config, url: str) -> bool:
     Returns:
         True if notification sent successfully, False otherwise.
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = format_timestamp()
 
     subject = "🔔 Developer Update Detected"
 
@@ -0,0 +1,12 @@
+"""Timestamp formatting shared by logging and notifications."""
+
+import time
+
+
+def format_timestamp() -> str:
+    """Format the current local time as YYYY-MM-DD HH:MM:SS."""
+    t = time.localtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
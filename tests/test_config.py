@@ -0,0 +1,57 @@
+"""Tests for the config module."""
+
+import pytest
+
+from src.config import Config, ConfigError, validate_config
+
+
+def make_config(**overrides):
+    """Create a valid configuration, overriding selected fields."""
+    values = {
+        "monitor_url": "https://example.com/developer",
+        "email_from": "sender@example.com",
+        "email_to": "recipient@example.com",
+        "email_password": "test_password",
+    }
+    values.update(overrides)
+    return Config(**values)
+
+
+class TestValidateConfig:
+    """Tests for validate_config function."""
+
+    def test_valid_config(self):
+        """Should accept a valid configuration."""
+        validate_config(make_config())
+
+    def test_invalid_url(self):
+        """Should reject URLs without an http(s) scheme."""
+        with pytest.raises(ConfigError, match="MONITOR_URL"):
+            validate_config(make_config(monitor_url="example.com"))
+
+    @pytest.mark.parametrize(
+        "address",
+        [
+            "sender",
+            "@example.com",
+            "sender@",
+            "sender@example",
+            "a b@example.com",
+            "a@b@c.com",
+            "sender@example.com\n",
+        ],
+    )
+    def test_invalid_email_from(self, address):
+        """Should reject malformed sender addresses."""
+        with pytest.raises(ConfigError, match="EMAIL_FROM"):
+            validate_config(make_config(email_from=address))
+
+    def test_invalid_email_to(self):
+        """Should reject malformed recipient addresses."""
+        with pytest.raises(ConfigError, match="EMAIL_TO"):
+            validate_config(make_config(email_to="recipient@"))
+
+    def test_invalid_smtp_port(self):
+        """Should reject out-of-range SMTP ports."""
+        with pytest.raises(ConfigError, match="EMAIL_SMTP_PORT"):
+            validate_config(make_config(email_smtp_port=70000))
@@ -2,17 +2,42 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
+from src.config import Config
 from src.monitor import (
+    MonitorError,
+    PageResponse,
+    _compiled_selector,
+    _get_session,
+    _extract_with_lexbor,
+    _extract_with_soup,
+    check_for_changes,
+    check_pages,
+    close_session,
     compute_hash,
     extract_content,
+    fetch_page_content,
     load_previous_hash,
+    load_state,
     save_hash,
 )
 
 
+def make_response(text="", status_code=200, headers=None):
+    """Build a mock streamed requests response."""
+    body = text.encode("utf-8")
+    response = MagicMock()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    response.headers = headers or {}
+    response.iter_content.return_value = [body[:4], body[4:]]
+    return response
+
+
 class TestComputeHash:
     """Tests for compute_hash function."""
 
@@ -39,6 +64,98 @@ class TestComputeHash:
         result = compute_hash("你好世界 🌍")
         assert len(result) == 64
 
+    def test_bytes_match_utf8_text(self):
+        """Bytes should hash the same as their UTF-8 decoded text."""
+        assert compute_hash("你好世界".encode("utf-8")) == compute_hash("你好世界")
+
+
+class TestFetchPageContent:
+    """Tests for fetch_page_content function."""
+
+    @patch("src.monitor._SESSION")
+    def test_returns_page_text(self, mock_session):
+        """Should return the response body via the shared session."""
+        mock_session.get.return_value = make_response(
+            "<html>Hi</html>", headers={"ETag": '"v1"', "Last-Modified": "Mon"}
+        )
+
+        result = fetch_page_content("https://example.com", timeout=5)
+
+        assert result == PageResponse(
+            b"<html>Hi</html>",
+            "utf-8",
+            '"v1"',
+            "Mon",
+            raw_hash=compute_hash(b"<html>Hi</html>"),
+        )
+        assert result.text == "<html>Hi</html>"
+        mock_session.get.assert_called_once_with(
+            "https://example.com", headers={}, timeout=5, stream=True
+        )
+
+    def test_unknown_charset_falls_back_to_utf8(self):
+        """Should decode as UTF-8 when the declared charset is unknown."""
+        page = PageResponse("héllo".encode("utf-8"), encoding="foo-bogus")
+
+        assert page.text == "héllo"
+
+    @patch("src.monitor._SESSION")
+    def test_sends_conditional_headers(self, mock_session):
+        """Should send stored validators as conditional request headers."""
+        mock_session.get.return_value = make_response("<html>Hi</html>")
+
+        fetch_page_content("https://example.com", etag='"v1"', last_modified="Mon")
+
+        headers = mock_session.get.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+
+    @patch("src.monitor._SESSION")
+    def test_not_modified_returns_none(self, mock_session):
+        """Should return None when the server answers 304."""
+        mock_session.get.return_value = make_response(status_code=304)
+
+        assert fetch_page_content("https://example.com", etag='"v1"') is None
+
+    @patch("src.monitor._SESSION")
+    def test_http_error_raises_error(self, mock_session):
+        """Should report the HTTP status once retries are exhausted."""
+        response = make_response(status_code=503)
+        response.reason = "Service Unavailable"
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+        mock_session.get.return_value = response
+
+        with pytest.raises(MonitorError, match="HTTP error 503: Service Unavailable"):
+            fetch_page_content("https://example.com")
+
+    def test_retries_return_final_response(self):
+        """Should leave the final error response to raise_for_status()."""
+        try:
+            retries = _get_session().get_adapter("https://example.com").max_retries
+        finally:
+            close_session()
+
+        assert retries.raise_on_status is False
+        assert retries.respect_retry_after_header is False
+        assert 503 in retries.status_forcelist
+
+    @patch("src.monitor._SESSION")
+    def test_timeout_raises_error(self, mock_session):
+        """Should wrap timeouts in MonitorError."""
+        mock_session.get.side_effect = requests.exceptions.Timeout()
+
+        with pytest.raises(MonitorError, match="timed out"):
+            fetch_page_content("https://example.com", timeout=5)
+
+    @patch("src.monitor._SESSION")
+    def test_connection_error_raises_error(self, mock_session):
+        """Should wrap connection failures in MonitorError."""
+        mock_session.get.side_effect = requests.exceptions.ConnectionError()
+
+        with pytest.raises(MonitorError, match="Failed to connect"):
+            fetch_page_content("https://example.com")
+
 
 class TestExtractContent:
     """Tests for extract_content function."""
@@ -94,6 +211,72 @@ class TestExtractContent:
         with pytest.raises(MonitorError, match="did not match"):
             extract_content(html, "#nonexistent")
 
+    def test_unparseable_selector_raises_error(self):
+        """Should raise MonitorError for a malformed selector."""
+        html = "<html><body><p>B</p></body></html>"
+        with pytest.raises(MonitorError, match="Invalid CSS selector"):
+            extract_content(html, "p[")
+
+    def test_soupsieve_only_selector_raises_error(self):
+        """Should raise MonitorError for soupsieve extensions lexbor can't parse."""
+        pytest.importorskip("selectolax")
+        html = "<html><body><p>B</p></body></html>"
+        with pytest.raises(MonitorError, match="Invalid CSS selector"):
+            extract_content(html, 'p:-soup-contains("B")')
+
+    @pytest.mark.parametrize(
+        "html, selector",
+        [
+            ("<html><body><p>Hello</p><p>World</p></body></html>", None),
+            ('<html><body><div class="ad-banner">Buy!</div><p>Content</p></body></html>', None),
+            ('<html><body><span data-nonce="x1">n</span><p>Content</p></body></html>', None),
+            ('<html><body><div class="x TRACKING">t</div><p>Content</p></body></html>', None),
+            ('<html class="js-loaded"><body><p>Content</p></body></html>', None),
+            ('<html data-nonce="1"><body><p>Content</p></body></html>', None),
+            ('<html><head><title>T</title></head><body class="wf-ad"><p>x</p></body></html>', None),
+            (
+                '<html><body><div class="ad"><p data-timestamp="1">t<script>s</script></p>'
+                "</div><p>Content</p></body></html>",
+                None,
+            ),
+            ('<html><body><div id="content"><p>Main</p> <p>Content</p></div></body></html>', "#content"),
+        ],
+    )
+    def test_backends_agree(self, html, selector):
+        """Lexbor and BeautifulSoup backends should extract the same text."""
+        pytest.importorskip("selectolax")
+        pytest.importorskip("bs4")
+        lexbor = " ".join(_extract_with_lexbor(html, selector).split())
+        soup = " ".join(_extract_with_soup(html, selector).split())
+        assert lexbor == soup
+
+    def test_selector_compiled_once(self):
+        """Should reuse the compiled selector for repeated lookups."""
+        pytest.importorskip("soupsieve")
+        assert _compiled_selector("#content") is _compiled_selector("#content")
+
+    def test_root_with_tracking_class(self):
+        """Should not crash when the <html> element itself matches."""
+        html = '<html class="js-loaded"><body><p>Content</p></body></html>'
+        assert extract_content(html, None) == ""
+        with pytest.raises(MonitorError, match="did not match"):
+            extract_content(html, "p")
+
+    def test_strips_nested_dynamic_elements(self):
+        """Should remove dynamic elements nested inside removed elements."""
+        html = (
+            '<html><body><div class="tracking"><span data-nonce="1">n</span>'
+            "<style>.x{}</style></div><p>Content</p></body></html>"
+        )
+        assert extract_content(html, None) == "Content"
+
+    def test_strips_tracking_classes(self):
+        """Should remove elements with tracking/ad classes."""
+        html = '<html><body><div class="analytics">Pixel</div><p>Content</p></body></html>'
+        result = extract_content(html, None)
+        assert "Pixel" not in result
+        assert "Content" in result
+
 
 class TestHashFileOperations:
     """Tests for load_previous_hash and save_hash functions."""
@@ -126,7 +309,7 @@ class TestHashFileOperations:
         save_hash(str(hash_file), "abc123")
 
         assert hash_file.exists()
-        assert hash_file.read_text() == "abc123"
+        assert load_previous_hash(str(hash_file)) == "abc123"
 
     def test_save_creates_directories(self, tmp_path):
         """Should create parent directories if needed."""
@@ -141,4 +324,174 @@ class TestHashFileOperations:
         hash_file.write_text("old_hash")
 
         save_hash(str(hash_file), "new_hash")
-        assert hash_file.read_text() == "new_hash"
+        assert load_previous_hash(str(hash_file)) == "new_hash"
+
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """Should replace the hash file atomically without leftovers."""
+        hash_file = tmp_path / "hash.txt"
+        save_hash(str(hash_file), "abc123")
+        save_hash(str(hash_file), "def456")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["hash.txt"]
+        assert load_previous_hash(str(hash_file)) == "def456"
+
+    def test_save_stores_validators(self, tmp_path):
+        """Should persist cache validators alongside the hash."""
+        hash_file = tmp_path / "hash.txt"
+        save_hash(str(hash_file), "abc123", etag='"v1"', last_modified="Mon")
+
+        state = load_state(str(hash_file))
+        assert state == {
+            "hash": "abc123",
+            "etag": '"v1"',
+            "last_modified": "Mon",
+            "raw_hash": None,
+        }
+
+    def test_load_state_legacy_file(self, tmp_path):
+        """Should read a bare-hash file as state without validators."""
+        hash_file = tmp_path / "hash.txt"
+        hash_file.write_text("abc123\n")
+
+        assert load_state(str(hash_file)) == {"hash": "abc123"}
+
+
+@pytest.fixture
+def monitor_config(tmp_path):
+    """Create a configuration pointing at a temporary hash file."""
+    return Config(
+        monitor_url="https://example.com/developer",
+        email_from="sender@example.com",
+        email_to="recipient@example.com",
+        email_password="test_password",
+        hash_storage_path=str(tmp_path / "hash.txt"),
+    )
+
+
+class TestCheckForChanges:
+    """Tests for check_for_changes function."""
+
+    @patch("src.monitor._SESSION")
+    def test_first_run_saves_baseline(self, mock_session, monitor_config):
+        """Should save a baseline and report no change on first run."""
+        mock_session.get.return_value = make_response("<p>Hello</p>")
+
+        has_changed, message = check_for_changes(monitor_config)
+
+        assert has_changed is False
+        assert "First run" in message
+        assert load_previous_hash(monitor_config.hash_storage_path) == compute_hash("Hello")
+
+    @patch("src.monitor._SESSION")
+    def test_detects_change(self, mock_session, monitor_config):
+        """Should report a change when extracted content differs."""
+        save_hash(monitor_config.hash_storage_path, compute_hash("Hello"))
+        mock_session.get.return_value = make_response("<p>Goodbye</p>")
+
+        has_changed, _ = check_for_changes(monitor_config)
+
+        assert has_changed is True
+        assert load_previous_hash(monitor_config.hash_storage_path) == compute_hash("Goodbye")
+
+    @patch("src.monitor.extract_content")
+    @patch("src.monitor._SESSION")
+    def test_not_modified_skips_extraction(self, mock_session, mock_extract, monitor_config):
+        """Should short-circuit on 304 without parsing the page."""
+        save_hash(monitor_config.hash_storage_path, "abc123", etag='"v1"')
+        mock_session.get.return_value = make_response(status_code=304)
+
+        has_changed, message = check_for_changes(monitor_config)
+
+        assert has_changed is False
+        assert "304" in message
+        mock_extract.assert_not_called()
+        headers = mock_session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+
+    @patch("src.monitor.extract_content")
+    @patch("src.monitor._SESSION")
+    def test_raw_match_skips_extraction(self, mock_session, mock_extract, monitor_config):
+        """Should not parse the page when the raw body is byte-identical."""
+        html = "<p>Hello</p>"
+        save_hash(monitor_config.hash_storage_path, "abc123", raw_hash=compute_hash(html))
+        mock_session.get.return_value = make_response(html)
+
+        has_changed, message = check_for_changes(monitor_config)
+
+        assert has_changed is False
+        assert "raw match" in message
+        mock_extract.assert_not_called()
+
+    @patch("src.monitor._SESSION")
+    def test_raw_mismatch_updates_raw_hash(self, mock_session, monitor_config):
+        """Should record the new raw hash when only page noise changed."""
+        save_hash(monitor_config.hash_storage_path, compute_hash("Hello"), raw_hash="old")
+        mock_session.get.return_value = make_response("<p>Hello</p><script>1</script>")
+
+        has_changed, message = check_for_changes(monitor_config)
+
+        assert has_changed is False
+        assert "content did not" in message
+        state = load_state(monitor_config.hash_storage_path)
+        assert state["hash"] == compute_hash("Hello")
+        assert state["raw_hash"] == compute_hash("<p>Hello</p><script>1</script>")
+
+
+class TestCheckPages:
+    """Tests for check_pages function."""
+
+    @patch("src.monitor._SESSION")
+    def test_checks_each_target(self, mock_session, tmp_path):
+        """Should check every target against its own hash file."""
+        pages = {
+            "https://example.com/a": "<p>Alpha</p>",
+            "https://example.com/b": "<p>Beta</p>",
+        }
+        mock_session.get.side_effect = lambda url, **kwargs: make_response(pages[url])
+        path_a = str(tmp_path / "a.txt")
+        path_b = str(tmp_path / "b.txt")
+        save_hash(path_b, compute_hash("Old"))
+
+        results = check_pages([
+            ("https://example.com/a", None, path_a),
+            ("https://example.com/b", None, path_b),
+        ])
+
+        assert results[0] == (False, "First run - baseline hash saved")
+        assert results[1] == (True, "Change detected on monitored page")
+        assert load_previous_hash(path_a) == compute_hash("Alpha")
+        assert load_previous_hash(path_b) == compute_hash("Beta")
+
+    @patch("src.monitor._SESSION")
+    def test_failure_keeps_other_results(self, mock_session, tmp_path):
+        """Should report a changed page even when another target fails."""
+        def get(url, **kwargs):
+            if url == "https://example.com/b":
+                raise requests.exceptions.ConnectionError()
+            return make_response("<p>New</p>")
+
+        mock_session.get.side_effect = get
+        path_a = str(tmp_path / "a.txt")
+        save_hash(path_a, compute_hash("Old"))
+
+        results = check_pages([
+            ("https://example.com/a", None, path_a),
+            ("https://example.com/b", None, str(tmp_path / "b.txt")),
+        ])
+
+        assert results[0] == (True, "Change detected on monitored page")
+        assert isinstance(results[1], MonitorError)
+        assert "Failed to connect" in str(results[1])
+
+    @patch("src.monitor.check_page")
+    def test_unexpected_error_is_raised(self, mock_check_page, tmp_path):
+        """Should re-raise errors other than MonitorError after all pages run."""
+        mock_check_page.side_effect = [TypeError("bug"), (False, "No changes detected")]
+
+        with pytest.raises(TypeError, match="bug"):
+            check_pages([
+                ("https://example.com/a", None, str(tmp_path / "a.txt")),
+                ("https://example.com/b", None, str(tmp_path / "b.txt")),
+            ])
+
+        assert mock_check_page.call_count == 2
@@ -1,12 +1,18 @@
 """Tests for the notifier module."""
 
+import re
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.config import Config
-from src.notifier import notify_change, send_email
+from src.notifier import (
+    Notifier,
+    close_notifier,
+    notify_change,
+    send_email,
+)
 
 
 @pytest.fixture
@@ -22,14 +28,20 @@ def mock_config():
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_notifier():
+    """Drop the shared SMTP connection between tests."""
+    yield
+    close_notifier()
+
+
 class TestSendEmail:
     """Tests for send_email function."""
 
     @patch("src.notifier.smtplib.SMTP_SSL")
     def test_successful_send(self, mock_smtp_class, mock_config):
         """Should return True on successful send."""
-        mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp_class.return_value
 
         result = send_email(mock_config, "Test Subject", "Test Body")
 
@@ -44,7 +56,7 @@ class TestSendEmail:
         """Should return False and log error on auth failure."""
         import smtplib
 
-        mock_smtp_class.return_value.__enter__.side_effect = (
+        mock_smtp_class.return_value.login.side_effect = (
             smtplib.SMTPAuthenticationError(535, b"Auth failed")
         )
 
@@ -59,9 +71,7 @@ class TestSendEmail:
         """Should return False and log error on SMTP failure."""
         import smtplib
 
-        mock_smtp_class.return_value.__enter__.side_effect = (
-            smtplib.SMTPException("Connection refused")
-        )
+        mock_smtp_class.side_effect = smtplib.SMTPException("Connection refused")
 
         result = send_email(mock_config, "Test Subject", "Test Body")
 
@@ -72,8 +82,7 @@ class TestSendEmail:
     @patch("src.notifier.smtplib.SMTP_SSL")
     def test_email_structure(self, mock_smtp_class, mock_config):
         """Should create email with correct structure."""
-        mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp_class.return_value
 
         send_email(mock_config, "Test Subject", "Test Body")
 
@@ -87,6 +96,76 @@ class TestSendEmail:
         assert "Test Body" in msg.get_content()
 
 
+class TestNotifier:
+    """Tests for the Notifier class."""
+
+    @patch("src.notifier.smtplib.SMTP_SSL")
+    def test_reuses_connection(self, mock_smtp_class, mock_config):
+        """Should log in once and reuse the connection for later sends."""
+        mock_server = mock_smtp_class.return_value
+        mock_server.noop.return_value = (250, b"OK")
+        notifier = Notifier(mock_config)
+
+        assert notifier.send("First", "Body") is True
+        assert notifier.send("Second", "Body") is True
+
+        mock_smtp_class.assert_called_once()
+        mock_server.login.assert_called_once()
+        mock_server.noop.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+
+    @patch("src.notifier.smtplib.SMTP_SSL")
+    def test_reconnects_when_disconnected(self, mock_smtp_class, mock_config):
+        """Should open a new connection if the server dropped the old one."""
+        import smtplib
+
+        first, second = MagicMock(), MagicMock()
+        first.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp_class.side_effect = [first, second]
+        notifier = Notifier(mock_config)
+
+        notifier.send("First", "Body")
+        assert notifier.send("Second", "Body") is True
+
+        assert mock_smtp_class.call_count == 2
+        second.login.assert_called_once()
+        second.send_message.assert_called_once()
+
+    @patch("src.notifier.smtplib.SMTP_SSL")
+    def test_close_quits_connection(self, mock_smtp_class, mock_config):
+        """Should quit the SMTP session on close."""
+        notifier = Notifier(mock_config)
+        notifier.send("Subject", "Body")
+
+        notifier.close()
+
+        mock_smtp_class.return_value.quit.assert_called_once()
+
+    @patch("src.notifier.smtplib.SMTP_SSL")
+    def test_reconnects_on_non_250_noop(self, mock_smtp_class, mock_config):
+        """Should treat a non-250 noop reply as a dead connection."""
+        first, second = MagicMock(), MagicMock()
+        first.noop.return_value = (421, b"Timeout, closing connection")
+        mock_smtp_class.side_effect = [first, second]
+        notifier = Notifier(mock_config)
+
+        notifier.send("First", "Body")
+        assert notifier.send("Second", "Body") is True
+
+        assert mock_smtp_class.call_count == 2
+        assert first.send_message.call_count == 1
+        second.send_message.assert_called_once()
+
+    @patch("src.notifier.smtplib.SMTP_SSL")
+    def test_send_email_shares_connection(self, mock_smtp_class, mock_config):
+        """Should reuse one connection across send_email calls."""
+        mock_smtp_class.return_value.noop.return_value = (250, b"OK")
+        send_email(mock_config, "First", "Body")
+        send_email(mock_config, "Second", "Body")
+
+        mock_smtp_class.assert_called_once()
+
+
 class TestNotifyChange:
     """Tests for notify_change function."""
 
@@ -121,6 +200,16 @@ class TestNotifyChange:
         # Should contain a date-like pattern
         assert "Detected at:" in body_arg
 
+    @patch("src.notifier.send_email")
+    def test_timestamp_format(self, mock_send_email, mock_config):
+        """Should format the timestamp as YYYY-MM-DD HH:MM:SS."""
+        mock_send_email.return_value = True
+
+        notify_change(mock_config, "https://example.com/page")
+
+        body_arg = mock_send_email.call_args[0][2]
+        assert re.search(r"Detected at: \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\n", body_arg)
+
     @patch("src.notifier.send_email")
     def test_returns_send_email_result(self, mock_send_email, mock_config):
         """Should return whatever send_email returns."""
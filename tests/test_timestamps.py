@@ -0,0 +1,17 @@
+"""Tests for the timestamps module."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from src.timestamps import format_timestamp
+
+
+class TestFormatTimestamp:
+    """Tests for format_timestamp function."""
+
+    @patch("src.timestamps.time.localtime")
+    def test_zero_pads_fields(self, mock_localtime):
+        """Should format the local time as YYYY-MM-DD HH:MM:SS."""
+        mock_localtime.return_value = datetime(2024, 3, 5, 7, 8, 9).timetuple()
+
+        assert format_timestamp() == "2024-03-05 07:08:09"